@@ -16,6 +16,11 @@ async def main():
     )
     # Choose one of the problem classes
     problem_class = lbpp.PROBLEMS.STATIC.SIZE_3x3
+    # deterministic=False shares one Factorio server process across all the
+    # trials: create_world just clears and rebuilds the entities, avoiding a
+    # multi-second process restart per trial. Pass deterministic=True if you
+    # need bit-identical simulation between trials, at the cost of a full
+    # server reload each time (the map RNG state cannot be re-seeded in place).
     async with lbpp.Evaluator(problem_class, deterministic=False) as evaluator:
         for attempt in range(3):
             LOG.info("Attempt: %s", attempt)
@@ -1,3 +1,19 @@
+from typing import TYPE_CHECKING
+
 from .evaluator import *
 from .gym import GymEnv
 from .problems import *
+
+if TYPE_CHECKING:
+    from .problems import _Problems
+
+
+def __getattr__(name: str) -> "_Problems":
+    # PROBLEMS is a lazy attribute of the problems module (built on first
+    # access), so star-import misses it; forward package access explicitly.
+    # The import stays in-function to keep that laziness.
+    if name == "PROBLEMS":
+        from . import problems  # pylint: disable=import-outside-toplevel
+
+        return problems.PROBLEMS
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
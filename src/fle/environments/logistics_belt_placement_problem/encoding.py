@@ -10,37 +10,51 @@ from attr import define
 from ...factorio_server import world
 
 # entities we care to encode
-ENTITY_TYPES = [
+ENTITY_TYPES = (
     "fast-transport-belt",
     "stone-wall",
     "fle-void-fast-inserter",
     "steel-chest",
-]
+)
 
 # directions we care to encode
-DIRECTIONS = [
+DIRECTIONS = (
     world.defines.direction.north,
     world.defines.direction.east,
     world.defines.direction.south,
     world.defines.direction.west,
-]
+)
 
+# O(1) lookups for the hot encoding paths, instead of list.index scans
+_NAME_IDX = {name: index for index, name in enumerate(ENTITY_TYPES)}
+_DIR_IDX = {direction: index for index, direction in enumerate(DIRECTIONS)}
+_N_DIRS = len(DIRECTIONS)
 
-@define
+
+# frozen: instances are shared via _DECODE_TABLE, so they must stay immutable
+@define(frozen=True)
 class EntityNameAndDirection:
     name: str
     direction: world.defines.direction
 
 
 def encode_entity(e: EntityNameAndDirection) -> int:
-    assert e.name in ENTITY_TYPES, "Un-encodable entity"
-    assert e.direction in DIRECTIONS, "Un-encodable direction"
+    assert e.name in _NAME_IDX, "Un-encodable entity"
+    assert e.direction in _DIR_IDX, "Un-encodable direction"
     # +1 for the zero which == empty space
-    return (
-        (ENTITY_TYPES.index(e.name) * len(DIRECTIONS))
-        + DIRECTIONS.index(e.direction)
-        + 1
-    )
+    return (_NAME_IDX[e.name] * _N_DIRS) + _DIR_IDX[e.direction] + 1
+
+
+# Precomputed once at module load; encode/decode are hot paths and the
+# vocabulary is fixed
+_MAX_OBS_EXCLUSIVE = encode_entity(
+    EntityNameAndDirection(ENTITY_TYPES[-1], DIRECTIONS[-1])
+)
+_DECODE_TABLE = (None,) + tuple(
+    EntityNameAndDirection(name, direction)
+    for name in ENTITY_TYPES
+    for direction in DIRECTIONS
+)
 
 
 def get_max_encoded_action_value_exclusive():
@@ -49,60 +63,75 @@ def get_max_encoded_action_value_exclusive():
 
 def get_max_encoded_observation_value_exclusive():
     """Returns 1 past the lagest valid number the encoder can produce"""
-    return encode_entity(EntityNameAndDirection(ENTITY_TYPES[-1], DIRECTIONS[-1]))
+    return _MAX_OBS_EXCLUSIVE
 
 
 def decode_entity(num: int) -> Optional[EntityNameAndDirection]:
     """Returns None for un-decodable input"""
-    # -1 for the zero which == empty space
-    type_index, direction_index = divmod(num - 1, len(DIRECTIONS))
-    if type_index < len(ENTITY_TYPES):
-        return EntityNameAndDirection(
-            ENTITY_TYPES[type_index], DIRECTIONS[direction_index]
-        )
+    # index 0 is None for the zero which == empty space
+    if 0 < num < len(_DECODE_TABLE):
+        return _DECODE_TABLE[num]
     return None
 
 
 def encode_observation(
-    dimension: int, entities: List[world.EntityDescription]
+    dimension: int,
+    entities: List[world.EntityDescription],
+    out: Optional[npt.NDArray[np.uint8]] = None,
 ) -> npt.NDArray[np.uint8]:
-    result = np.zeros((dimension + 4, dimension + 4), dtype=np.uint8)
-    for entity in entities:
-        if entity.name not in ENTITY_TYPES:
-            # Disregard entities which we are not encoding
-            continue
-        # Factorio reports in floating coords, using the midpoint of squares
-        x = math.floor(entity.position.x)
-        y = math.floor(entity.position.y)
-        # Offset by 2 for the walls
-        x += 2
-        y += 2
-        cur_value = result[x, y]
-        assert cur_value == 0, "Entity overlap was unexpected"
-        result[x, y] = encode_entity(
-            EntityNameAndDirection(entity.name, entity.direction)
-        )
+    if out is None:
+        result = np.zeros((dimension + 4, dimension + 4), dtype=np.uint8)
+    else:
+        # Callers in a hot loop can reuse a preallocated buffer
+        assert out.shape == (dimension + 4, dimension + 4)
+        out.fill(0)
+        result = out
+    # Disregard entities which we are not encoding
+    encodable = [e for e in entities if e.name in _NAME_IDX]
+    if not encodable:
+        return result
+    num_entities = len(encodable)
+    # Factorio reports in floating coords, using the midpoint of squares.
+    # Offset by 2 for the walls.
+    xs = np.fromiter(
+        (math.floor(e.position.x) + 2 for e in encodable),
+        dtype=np.intp,
+        count=num_entities,
+    )
+    ys = np.fromiter(
+        (math.floor(e.position.y) + 2 for e in encodable),
+        dtype=np.intp,
+        count=num_entities,
+    )
+    # +1 for the zero which == empty space
+    name_idx = _NAME_IDX
+    dir_idx = _DIR_IDX
+    codes = np.fromiter(
+        ((name_idx[e.name] * _N_DIRS) + dir_idx[e.direction] + 1 for e in encodable),
+        dtype=np.uint8,
+        count=num_entities,
+    )
+    result[xs, ys] = codes
+    # All codes are non-zero, so an overlap shows up as a missing non-zero cell
+    assert np.count_nonzero(result) == num_entities, "Entity overlap was unexpected"
     return result
 
 
 def decode_action(
     dimension: int, _matrix: npt.ArrayLike
 ) -> List[world.CreateEntityParams]:
-    matrix = np.asarray(_matrix)
-    assert len(matrix) == dimension
-    entities_to_construct = []
-    for x, col in enumerate(matrix):
-        assert len(col) == dimension
-        for y, encoded_entity in enumerate(col):
-            name_and_direction = decode_entity(encoded_entity)
-            if name_and_direction is not None:
-                # The only item we allow creation of atm
-                if name_and_direction.name == "fast-transport-belt":
-                    entities_to_construct.append(
-                        world.CreateEntityParams(
-                            name_and_direction.name,
-                            world.Position(x, y),
-                            name_and_direction.direction,
-                        )
-                    )
-    return entities_to_construct
+    matrix = np.ascontiguousarray(_matrix, dtype=np.uint8)
+    assert matrix.shape == (dimension, dimension)
+    # Belts are the only item we allow creation of atm; they encode to
+    # 1..len(DIRECTIONS) because "fast-transport-belt" is the first entity type
+    belt_mask = (matrix >= 1) & (matrix <= len(DIRECTIONS))
+    xs, ys = np.nonzero(belt_mask)
+    codes = matrix[xs, ys]
+    return [
+        world.CreateEntityParams(
+            "fast-transport-belt",
+            world.Position(int(x), int(y)),
+            DIRECTIONS[int(code) - 1],
+        )
+        for x, y, code in zip(xs, ys, codes)
+    ]
@@ -1,5 +1,6 @@
-from typing import Optional
+from typing import List, Optional
 
+import asyncio
 import importlib.resources
 import logging
 import math
@@ -24,8 +25,59 @@ def integer_position_equal(a: world.Position, b: world.Position) -> bool:
     return math.floor(a.x) == math.floor(b.x) and math.floor(a.y) == math.floor(b.y)
 
 
+def _build_problem_entities(problem: Problem) -> List[world.CreateEntityParams]:
+    """Builds the scaffolding entity list (inserters, chests, walls) for a problem
+
+    The Evaluator caches the result per Problem instance, so callers must not
+    mutate it.
+    """
+    entities = [
+        world.CreateEntityParams(
+            "fle-void-fast-inserter",
+            problem.input_location.position,
+            problem.input_location.direction,
+        ),
+        world.CreateEntityParams(
+            "fle-void-fast-inserter",
+            problem.output_location.position,
+            problem.output_location.direction,
+        ),
+        world.CreateEntityParams("steel-chest", problem.get_input_chest_pos()),
+        world.CreateEntityParams("steel-chest", problem.get_output_chest_pos()),
+    ]
+    # The inserters and chests all sit in the wall border, keep their tiles clear
+    occupied = {
+        (math.floor(e.position.x), math.floor(e.position.y))
+        for e in entities
+        if e.position is not None
+    }
+
+    def add_wall(x: int, y: int) -> None:
+        if (x, y) not in occupied:
+            entities.append(
+                world.CreateEntityParams("stone-wall", world.Position(x, y))
+            )
+
+    # Walls fill the 2-tile border around the problem space; enumerate just
+    # the border strips rather than scanning the whole (dim+4)^2 square
+    dim = problem.dimension
+    for x in range(-2, dim + 2):
+        for y in (-2, -1, dim, dim + 1):
+            add_wall(x, y)
+    for x in (-2, -1, dim, dim + 1):
+        for y in range(dim):
+            add_wall(x, y)
+    for wall_pos in problem.wall_obstacles:
+        entities.append(world.CreateEntityParams("stone-wall", wall_pos))
+    return entities
+
+
 @define
 class Evaluator(anyio.abc.AsyncResource):
+    # The observation/scaffolding caches below push this class past pylint's
+    # attribute cap; they are plain per-instance caches over the existing
+    # state and would only gain indirection from a wrapper object
+    # pylint: disable=too-many-instance-attributes
     problem_class: ProblemClass
     # The RNG seed is a persisted part of the simulation state which cannot be re-seeded
     # after the initial map creation (from a seed) occurs. Thie means that we have a choice
@@ -37,6 +89,14 @@ class Evaluator(anyio.abc.AsyncResource):
     current_problem: Optional[Problem] = None
     current_input_chest: Optional[world.EntityDescription] = None
     current_output_chest: Optional[world.EntityDescription] = None
+    # Observation of the scaffolding (walls, inserters, chests), which never
+    # changes between create_world calls; lets get_observation query only the
+    # interior the agent can modify
+    _baseline_obs: Optional[npt.NDArray[np.uint8]] = None
+    # Scaffolding template cache keyed by Problem identity; static problem
+    # classes hand back the same Problem every trial so this builds once
+    _cached_problem: Optional[Problem] = None
+    _cached_problem_entities: Optional[List[world.CreateEntityParams]] = None
 
     async def create_world(self) -> None:
         if self.deterministic:
@@ -51,43 +111,14 @@ class Evaluator(anyio.abc.AsyncResource):
         self.current_problem = self.problem_class.get_instance()
         input_chest_pos = self.current_problem.get_input_chest_pos()
         output_chest_pos = self.current_problem.get_output_chest_pos()
-        entities = []
-        for x in range(-2, self.current_problem.dimension + 2):
-            for y in range(-2, self.current_problem.dimension + 2):
-                pos = world.Position(x, y)
-                if pos == self.current_problem.input_location.position:
-                    entities.append(
-                        world.CreateEntityParams(
-                            "fle-void-fast-inserter",
-                            self.current_problem.input_location.position,
-                            self.current_problem.input_location.direction,
-                        )
-                    )
-                elif pos == self.current_problem.output_location.position:
-                    entities.append(
-                        world.CreateEntityParams(
-                            "fle-void-fast-inserter",
-                            self.current_problem.output_location.position,
-                            self.current_problem.output_location.direction,
-                        )
-                    )
-                elif pos == input_chest_pos:
-                    entities.append(
-                        world.CreateEntityParams("steel-chest", input_chest_pos)
-                    )
-                elif pos == output_chest_pos:
-                    entities.append(
-                        world.CreateEntityParams("steel-chest", output_chest_pos)
-                    )
-                elif (
-                    pos.x < 0
-                    or pos.y < 0
-                    or pos.x >= self.current_problem.dimension
-                    or pos.y >= self.current_problem.dimension
-                ):
-                    entities.append(world.CreateEntityParams("stone-wall", pos))
-        for wall_pos in self.current_problem.wall_obstacles:
-            entities.append(world.CreateEntityParams("stone-wall", wall_pos))
+        dim = self.current_problem.dimension
+        if self._cached_problem is not self.current_problem:
+            self._cached_problem = self.current_problem
+            self._cached_problem_entities = _build_problem_entities(
+                self.current_problem
+            )
+        entities = self._cached_problem_entities
+        assert entities is not None
         created_result = await self.server.world.create_entities(entities)
         if not all(created_result):
             LOG.error("created_result: %s", created_result)
@@ -97,34 +128,63 @@ class Evaluator(anyio.abc.AsyncResource):
         assert all(
             created_result
         ), "None of the entities in the problem definition should fail to create"
+        # Floor the chest positions once rather than per created entity
+        input_chest_key = (math.floor(input_chest_pos.x), math.floor(input_chest_pos.y))
+        output_chest_key = (
+            math.floor(output_chest_pos.x),
+            math.floor(output_chest_pos.y),
+        )
         for e in created_result:
             # we just asserted this but mypy is not smart enough to realize
             assert e is not None
             if e.name == "steel-chest":
-                if integer_position_equal(e.position, input_chest_pos):
+                chest_key = (math.floor(e.position.x), math.floor(e.position.y))
+                if chest_key == input_chest_key:
                     self.current_input_chest = e
-                elif integer_position_equal(e.position, output_chest_pos):
+                elif chest_key == output_chest_key:
                     self.current_output_chest = e
                 else:
                     assert False, "There should not be any other chests"
         assert self.current_input_chest is not None
+        self._baseline_obs = encode_observation(
+            dim, [e for e in created_result if e is not None]
+        )
         quantity_inserted = await self.server.world.insert_items(
             self.current_input_chest,
             world.SimpleItemStack("iron-ore", self.current_problem.input_ore_quantity),
         )
         assert quantity_inserted == self.current_problem.input_ore_quantity
 
-    async def get_observation(self) -> npt.NDArray[np.uint8]:
+    async def get_observation(
+        self, out: Optional[npt.NDArray[np.uint8]] = None
+    ) -> npt.NDArray[np.uint8]:
         assert self.current_problem is not None
         assert self.server is not None
-        max_coord = self.current_problem.dimension + 2
-        entities = await self.server.world.find_entities(
-            (
-                world.Position(-2, -2),
-                world.Position(max_coord, max_coord),
+        dim = self.current_problem.dimension
+        if self._baseline_obs is None:
+            max_coord = dim + 2
+            entities = await self.server.world.find_entities(
+                (
+                    world.Position(-2, -2),
+                    world.Position(max_coord, max_coord),
+                )
             )
+            return encode_observation(dim, entities, out=out)
+        # The scaffolding never changes after create_world, so only the belts
+        # in the interior need to be fetched and re-encoded
+        interior_entities = await self.server.world.find_entities(
+            (
+                world.Position(0, 0),
+                world.Position(dim, dim),
+            ),
+            name_filter=["fast-transport-belt"],
         )
-        return encode_observation(self.current_problem.dimension, entities)
+        interior_obs = encode_observation(dim, interior_entities)
+        combined = np.where(interior_obs != 0, interior_obs, self._baseline_obs)
+        if out is None:
+            return combined
+        np.copyto(out, combined)
+        return out
 
     async def _get_iron_ore_quantity(
         self, entity_description: world.EntityDescription
@@ -145,14 +205,17 @@ class Evaluator(anyio.abc.AsyncResource):
         )
         await self.server.world.create_entities(entities_to_create)
         await self.server.world.step(self.current_problem.ticks_for_evaluation)
+        # The two inventory reads are independent of each other, so issue them
+        # in one batch; the rcon client supports interleaved calls
+        input_quantity, output_quantity = await asyncio.gather(
+            self._get_iron_ore_quantity(self.current_input_chest),
+            self._get_iron_ore_quantity(self.current_output_chest),
+        )
         # Could be expanded to account for construction costs
         score = (
             self.current_problem.input_ore_quantity
-            - await self._get_iron_ore_quantity(self.current_input_chest)
-            + (
-                await self._get_iron_ore_quantity(self.current_output_chest)
-                * self.current_problem.input_ore_quantity
-            )
+            - input_quantity
+            + (output_quantity * self.current_problem.input_ore_quantity)
         )
         return score
 
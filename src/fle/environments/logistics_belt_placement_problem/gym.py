@@ -2,17 +2,19 @@
 
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-from functools import partial
+import copy
 
+import gym.error
 import gym.spaces
 import numpy as np
 import numpy.typing as npt
 from gym.envs import register as _register
 
 from ...gym.async_env import AsyncEnv
-from . import encoding
+from ...gym.vector import VectorGymEnv
+from . import encoding, problems
 from .evaluator import Evaluator
-from .problems import PROBLEMS, ProblemClass, _ProblemCategory
+from .problems import ProblemClass, _ProblemCategory
 
 
 class GymEnv(
@@ -27,7 +29,8 @@ class GymEnv(
         super().__init__()
         self.problem_class = problem_class
         self.evaluator = Evaluator(self.problem_class, deterministic)
-        dim = self.problem_class.get_dimension()
+        # The dimension is fixed per problem class; cache it off the step path
+        self._dim = dim = self.problem_class.get_dimension()
         max_action = encoding.get_max_encoded_action_value_exclusive()
         # pylint: disable-next=attribute-defined-outside-init
         self.action_space = gym.spaces.MultiDiscrete([max_action] * (dim * dim))
@@ -37,22 +40,36 @@ class GymEnv(
         self.observation_space = gym.spaces.MultiDiscrete(
             [max_observation] * num_observation_tiles
         )
+        # Reused across steps to avoid a fresh allocation per observation
+        self._obs_buffer = np.zeros((dim + 4, dim + 4), dtype=np.uint8)
 
     async def _get_1d_observation(self) -> npt.NDArray[np.uint8]:
-        dim = self.problem_class.get_dimension() + 4
-        obs_matrix = await self.evaluator.get_observation()
+        dim = self._dim + 4
+        obs_matrix = await self.evaluator.get_observation(out=self._obs_buffer)
         obs_array = obs_matrix.reshape(dim * dim)
         return obs_array
 
     async def _step_async(
         self, action: npt.ArrayLike
     ) -> Tuple[npt.NDArray[np.uint8], float, bool, Dict[str, Any]]:
-        dim = self.problem_class.get_dimension()
-        action_matrix = np.asarray(action).reshape((dim, dim))
+        dim = self._dim
+        action_matrix = np.asarray(action, dtype=np.uint8).reshape((dim, dim))
         fitness = await self.evaluator.evaluate_fitness(action_matrix)
         obs = await self._get_1d_observation()
         return (obs, fitness, True, {})
 
+    async def step_into_async(
+        self, action: npt.ArrayLike, obs_out: npt.NDArray[np.uint8]
+    ) -> Tuple[float, bool, Dict[str, Any]]:
+        """Fills the caller's flat observation buffer directly, no copies"""
+        dim = self._dim
+        action_matrix = np.asarray(action, dtype=np.uint8).reshape((dim, dim))
+        fitness = await self.evaluator.evaluate_fitness(action_matrix)
+        obs_dim = dim + 4
+        # reshape is a view, so the evaluator encodes straight into obs_out
+        await self.evaluator.get_observation(out=obs_out.reshape((obs_dim, obs_dim)))
+        return (fitness, True, {})
+
     async def _reset_async(
         self,
         *,
@@ -76,35 +93,72 @@ class GymEnv(
         return [self.problem_class.get_seed()]
 
 
+def make_vector_env(
+    problem_class: ProblemClass, num_envs: int, deterministic: bool = False
+) -> VectorGymEnv:
+    """Pools num_envs GymEnvs (one factorio server each) behind the batched
+    vector API, so the servers' simulation windows overlap per step.
+
+    Each env gets its own deep copy of problem_class: seeding is mutable
+    per-instance state, so with a shared instance the vector reset's
+    per-env seeds would overwrite each other before any problem is drawn.
+    """
+    return VectorGymEnv(
+        lambda: GymEnv(copy.deepcopy(problem_class), deterministic), num_envs
+    )
+
+
+_SIZE_ATTRS = {"3x3": "SIZE_3x3", "6x6": "SIZE_6x6", "12x12": "SIZE_12x12"}
+
+
 def _get_problem_class(cat: _ProblemCategory, size_name: str) -> ProblemClass:
-    if size_name == "3x3":
-        return cat.SIZE_3x3
-    if size_name == "6x6":
-        return cat.SIZE_6x6
-    if size_name == "12x12":
-        return cat.SIZE_12x12
-    raise Exception(f"Bad size {size_name}")
+    try:
+        attr_name = _SIZE_ATTRS[size_name]
+    except KeyError:
+        raise Exception(f"Bad size {size_name}") from None
+    problem_class: ProblemClass = getattr(cat, attr_name)
+    return problem_class
+
+
+def _make_env(category_name: str, size_name: str, deterministic: bool) -> GymEnv:
+    """Entry-point factory, resolves the problem class only when gym.make runs"""
+    problems_index = problems.PROBLEMS
+    categories = {"Static": problems_index.STATIC, "Dynamic": problems_index.DYNAMIC}
+    problem_class = _get_problem_class(categories[category_name], size_name)
+    return GymEnv(problem_class, deterministic)
 
 
 def register():
-    categories = {"Static": PROBLEMS.STATIC, "Dynamic": PROBLEMS.DYNAMIC}
+    """Registers the envs with gym. Runs on import; calling again is a no-op."""
+    category_names = ["Static", "Dynamic"]
     size_names = ["3x3", "6x6", "12x12"]
     determinism_option = {
         "Deterministic": True,
         "Nondeterministic": False,
     }
-    for category_name, category in categories.items():
-        for size_name in size_names:
-            for (
-                determinism_option_name,
-                determinism_option_value,
-            ) in determinism_option.items():
-                problem_class = _get_problem_class(category, size_name)
-                _register(
-                    id=f"factorio-learning-environment/LogisticsBeltPlacementProblem-{category_name}-{size_name}-{determinism_option_name}-v0",
-                    entry_point=partial(
-                        GymEnv, problem_class, determinism_option_value
-                    ),
-                    kwargs={},
-                    reward_threshold=2352,
-                )
+    try:
+        for category_name in category_names:
+            for size_name in size_names:
+                for (
+                    determinism_option_name,
+                    determinism_option_value,
+                ) in determinism_option.items():
+                    _register(
+                        id=f"factorio-learning-environment/LogisticsBeltPlacementProblem-{category_name}-{size_name}-{determinism_option_name}-v0",
+                        entry_point=f"{__name__}:_make_env",
+                        kwargs={
+                            "category_name": category_name,
+                            "size_name": size_name,
+                            "deterministic": determinism_option_value,
+                        },
+                        reward_threshold=2352,
+                    )
+    except gym.error.Error:
+        # Already registered (a previous call did all ids, so stopping at the
+        # first duplicate loses nothing), e.g. this module was reloaded
+        pass
+
+
+# Register on import; the entry points are strings so this pulls in no
+# problem data (see _make_env)
+register()
@@ -1,6 +1,8 @@
 """Index of and generator of belt placement Problems"""
 from typing import List, Optional
 
+import asyncio
+import concurrent.futures
 import random
 import sys
 from abc import ABC, abstractmethod
@@ -10,7 +12,7 @@ from attr import define, field
 from ...factorio_server import world
 
 
-@define
+@define(frozen=True)
 class Transform:
     position: world.Position
     direction: world.defines.direction
@@ -20,13 +22,25 @@ def random_position(x_excl: int, y_excl: int, prng: random.Random) -> world.Posi
     return world.Position(prng.randrange(x_excl), prng.randrange(y_excl))
 
 
+# Collection-side inserter direction for each outer edge (see the diagram in
+# generate_problem); inputs face the opposite way
+_EDGE_OUTPUT_DIRECTIONS = (
+    world.defines.direction.east,
+    world.defines.direction.west,
+    world.defines.direction.south,
+    world.defines.direction.north,
+)
+_EDGE_INPUT_DIRECTIONS = tuple(
+    world.get_opposite_direction(d) for d in _EDGE_OUTPUT_DIRECTIONS
+)
+
 _MAX_PATH_LENGTH_FACTOR = 4  # 4 times the side length is a tour of the entire space
 _MAX_ITEMS_PER_BELT_TILE = 4
 _FAST_TRANSPORT_BELT_TRAVEL_SPEED = 3.75 / 60  # tiles per-tick
 _FAST_INSERTER_TICKS_PER_ROTATION = 26
 
 
-@define
+@define(frozen=True)
 class Problem:
     dimension: int
     input_location: Transform
@@ -65,11 +79,14 @@ class Problem:
 def generate_problem(dimension: int, prng: random.Random) -> Problem:
     """Generates problems. Should be deterministic given the same prng state.
     A small fraction of problems may actually be un-solvable."""
+    # Bound once; generation is called in bulk by benchmark sweeps and the
+    # attribute lookups add up in the rejection loops below
+    randrange = prng.randrange
 
     def random_outer_edge_pos(for_input):
         # possible positions are four times the side-length
         # sample a position and translate to a coordinate
-        linear_pos = prng.randrange(dimension * 4)
+        linear_pos = randrange(dimension * 4)
 
         def linear_to_outer_edge_pos(i: int) -> Transform:
             edge = i % 4
@@ -79,18 +96,12 @@ def generate_problem(dimension: int, prng: random.Random) -> Problem:
             # 1st edge  |__|  2nd edge
             #
             #          4th edge
-            x = [-1, dimension, offset, offset][edge]
-            y = [offset, offset, -1, dimension][edge]
-            # inserter direction points towards the collection side
-            direction = [
-                world.defines.direction.east,
-                world.defines.direction.west,
-                world.defines.direction.south,
-                world.defines.direction.north,
-            ][edge]
-            if for_input:
-                direction = world.get_opposite_direction(direction)
-            return Transform(world.Position(x, y), direction)
+            x = (-1, dimension, offset, offset)[edge]
+            y = (offset, offset, -1, dimension)[edge]
+            directions = (
+                _EDGE_INPUT_DIRECTIONS if for_input else _EDGE_OUTPUT_DIRECTIONS
+            )
+            return Transform(world.Position(x, y), directions[edge])
 
         return linear_to_outer_edge_pos(linear_pos)
 
@@ -108,25 +119,54 @@ def generate_problem(dimension: int, prng: random.Random) -> Problem:
         output_location.position, output_location.direction, 1
     )
     wall_obstacles = []
+    # O(1) membership for the rejection test below; the prng draw sequence is
+    # unchanged, so existing seeds keep generating identical problems
+    taken = {
+        (input_drop_location.x, input_drop_location.y),
+        (output_grab_location.x, output_grab_location.y),
+    }
     # dimension - 1 helps to avoid partitioning the space entirely
     # we could fit more obstacles if we bother to ensure solve-ablity
     for _ in range(dimension - 1):
         # Arbitrary iteration limit to avoid infinite loops
         for _ in range(1000):
-            wall_pos = random_position(dimension, dimension, prng)
-            if wall_pos == input_drop_location:
-                continue
-            if wall_pos == output_grab_location:
-                continue
-            if wall_pos in wall_obstacles:
-                continue
-            break
+            candidate = (randrange(dimension), randrange(dimension))
+            if candidate not in taken:
+                break
         else:
             raise Exception("Generation failed to add valid walls")
-        wall_obstacles.append(wall_pos)
+        taken.add(candidate)
+        wall_obstacles.append(world.Position(*candidate))
     return Problem(dimension, input_location, output_location, wall_obstacles)
 
 
+def _generate_seeded_problem(dimension: int, seed: int) -> Problem:
+    # Module-level so it's picklable for the process pool in generate_batch
+    return generate_problem(dimension, random.Random(seed))
+
+
+async def generate_batch(dimension: int, count: int, base_seed: int) -> List[Problem]:
+    """Generates count problems, e.g. to build a training batch.
+
+    Problem i is drawn from random.Random(base_seed + i), so any batch can be
+    reproduced (or regenerated in a different partitioning) from base_seed
+    alone. Generation is pure-python CPU work, so it runs on a process pool
+    to scale with cores rather than blocking the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    with concurrent.futures.ProcessPoolExecutor() as pool:
+        return list(
+            await asyncio.gather(
+                *[
+                    loop.run_in_executor(
+                        pool, _generate_seeded_problem, dimension, base_seed + i
+                    )
+                    for i in range(count)
+                ]
+            )
+        )
+
+
 class ProblemClass(ABC):
     @abstractmethod
     def get_dimension(self) -> int:
@@ -170,8 +210,10 @@ def _fix_seed(seed: Optional[int]) -> int:
 @define
 class DynamicProblem(ProblemClass):
     dimension: int
-    _seed: int = _fix_seed(None)
-    _prng = random.Random()
+    # Both defaults are factories: a class-level default would be evaluated
+    # once and shared, so seeding one instance would re-seed them all
+    _seed: int = field(factory=lambda: _fix_seed(None))
+    _prng: random.Random = field(factory=random.Random)
 
     def __attrs_post_init__(self):
         self._prng.seed(self._seed)
@@ -203,11 +245,28 @@ class _Problems:
     DYNAMIC: _ProblemCategory
 
 
-PROBLEMS = _Problems(
-    STATIC=_ProblemCategory(
-        StaticProblem(generate_problem(3, random.Random(42))),
-        StaticProblem(generate_problem(6, random.Random(43))),
-        StaticProblem(generate_problem(12, random.Random(44))),
-    ),
-    DYNAMIC=_ProblemCategory(DynamicProblem(3), DynamicProblem(6), DynamicProblem(12)),
-)
+def _build_problems() -> _Problems:
+    return _Problems(
+        STATIC=_ProblemCategory(
+            StaticProblem(generate_problem(3, random.Random(42))),
+            StaticProblem(generate_problem(6, random.Random(43))),
+            StaticProblem(generate_problem(12, random.Random(44))),
+        ),
+        DYNAMIC=_ProblemCategory(
+            DynamicProblem(3), DynamicProblem(6), DynamicProblem(12)
+        ),
+    )
+
+
+_PROBLEMS_CACHE: Optional[_Problems] = None
+
+
+def __getattr__(name: str) -> _Problems:
+    # PROBLEMS is built lazily so importing this module (e.g. just for
+    # ProblemClass) doesn't pay for three generate_problem calls
+    if name == "PROBLEMS":
+        global _PROBLEMS_CACHE  # pylint: disable=global-statement
+        if _PROBLEMS_CACHE is None:
+            _PROBLEMS_CACHE = _build_problems()
+        return _PROBLEMS_CACHE
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
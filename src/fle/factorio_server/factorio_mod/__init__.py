@@ -1,30 +1,44 @@
+from typing import Dict
+
 import importlib.resources
 import os
 import os.path
 
+import anyio
 from anyio import Path, open_file
 
 MOD_NAME = "factorio-learning-environment-mod"
 
 
-async def install_mod(target_mods_dir: str) -> None:
-    """Installs factorio-learning-environment-mod in to the given mods directory"""
-    mod_dir = os.path.join(target_mods_dir, MOD_NAME)
-    await Path(mod_dir).mkdir(parents=True, exist_ok=True)
+def _load_mod_files() -> Dict[str, bytes]:
+    """Reads the immutable mod resources once so each install is pure writes"""
     package_name = __package__ + "." + "mod_data"
-    files = importlib.resources.contents(package_name)
-    for filename in files:
+    files = {}
+    for filename in importlib.resources.contents(package_name):
         # TODO implement recursive copy for child dirs
         if (
             importlib.resources.is_resource(package_name, filename)
             and not filename == "__init__.py"
         ):
-            # open_binary won't translate text line endings but this probably is fine for factorio
-            with importlib.resources.open_binary(
-                package=package_name, resource=filename
-            ) as readable:
-                # assume files are smallish and read entirety
-                contents = readable.read()
-            target_path = os.path.join(mod_dir, filename)
-            async with await open_file(target_path, "wb") as target:
-                await target.write(contents)
+            # read_binary won't translate text line endings but this probably is fine for factorio
+            # assume files are smallish and read entirety
+            files[filename] = importlib.resources.read_binary(package_name, filename)
+    return files
+
+
+_MOD_FILES = _load_mod_files()
+
+
+async def install_mod(target_mods_dir: str) -> None:
+    """Installs factorio-learning-environment-mod in to the given mods directory"""
+    mod_dir = os.path.join(target_mods_dir, MOD_NAME)
+    await Path(mod_dir).mkdir(parents=True, exist_ok=True)
+
+    async def write_file(filename: str, contents: bytes) -> None:
+        target_path = os.path.join(mod_dir, filename)
+        async with await open_file(target_path, "wb") as target:
+            await target.write(contents)
+
+    async with anyio.create_task_group() as task_group:
+        for filename, contents in _MOD_FILES.items():
+            task_group.start_soon(write_file, filename, contents)
@@ -80,12 +80,16 @@ local function create_entity(config)
   return EntityDescription(e)
 end
 
-local function find_entities(area, surface_name)
+local function find_entities(area, surface_name, name_filter)
   local surface = game.surfaces[surface_name]
   if surface == nil then
     error(string.format('Could not find surface with id "%s"', surface_name))
   end
-  entities = surface.find_entities(area)
+  if name_filter == nil then
+    entities = surface.find_entities(area)
+  else
+    entities = surface.find_entities_filtered{area = area, name = name_filter}
+  end
   result = {}
   for _, e in ipairs(entities) do
     table.insert(result, EntityDescription(e))
@@ -174,7 +178,11 @@ local function call(request_string)
   return response
 end
 
-remote.add_interface('fle', { call = call })
+local function call_batch(request_string)
+  return rpc.dispatch_rpc_batch(rpcs, request_string)
+end
+
+remote.add_interface('fle', { call = call, call_batch = call_batch })
 
 script.on_init(function()
   global.target_tick = game.tick
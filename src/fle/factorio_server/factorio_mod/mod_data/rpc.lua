@@ -14,21 +14,7 @@ function serialize(value)
   return (string.gsub(game.table_to_json(value), '{}', '[]'))
 end
 
-local function invoke_rpc(procedures, request_string)
-  local deserialize_succeeded, deserialize_result = xpcall(
-    game.json_to_table,
-    debug.traceback,
-    request_string)
-  if not deserialize_succeeded then
-    return {
-      error = {
-        code = 400,
-        message = 'Failed to deserialize request_string',
-        data = deserialize_result
-      }
-    }
-  end
-  local request = deserialize_result
+local function dispatch_parsed(procedures, request)
   local method = procedures[request.method]
   if method == nil then
     return {
@@ -58,16 +44,58 @@ local function invoke_rpc(procedures, request_string)
   end
 end
 
-local function call_and_serialize_result(procedures, request_string)
-  return serialize(invoke_rpc(procedures, request_string))
+local function deserialize_request(request_string)
+  local deserialize_succeeded, deserialize_result = xpcall(
+    game.json_to_table,
+    debug.traceback,
+    request_string)
+  if not deserialize_succeeded then
+    return nil, {
+      error = {
+        code = 400,
+        message = 'Failed to deserialize request_string',
+        data = deserialize_result
+      }
+    }
+  end
+  return deserialize_result, nil
+end
+
+local function invoke_rpc(procedures, request_string)
+  local request, deserialize_error = deserialize_request(request_string)
+  if request == nil then
+    return deserialize_error
+  end
+  return dispatch_parsed(procedures, request)
+end
+
+-- request_string holds an array of requests, all dispatched within this call.
+-- Returns an array of responses in request order, or a single error object
+-- if the batch envelope itself could not be deserialized.
+local function invoke_rpc_batch(procedures, request_string)
+  local requests, deserialize_error = deserialize_request(request_string)
+  if requests == nil then
+    return deserialize_error
+  end
+  local responses = {}
+  for i, request in ipairs(requests) do
+    responses[i] = dispatch_parsed(procedures, request)
+  end
+  return responses
+end
+
+local function call_and_serialize_result(invoke, procedures, request_string)
+  return serialize(invoke(procedures, request_string))
 end
 
+-- invoke: invoke_rpc or invoke_rpc_batch
 -- procedures: A table of functions which can be called
 -- request_string: the un-parsed RPC call
-local function call_and_handle_unhandled_errors(procedures, request_string)
+local function call_and_handle_unhandled_errors(invoke, procedures, request_string)
   local suceeded, response = xpcall(
     call_and_serialize_result,
     debug.traceback,
+    invoke,
     procedures,
     request_string)
   if suceeded then
@@ -84,5 +112,10 @@ local function call_and_handle_unhandled_errors(procedures, request_string)
 end
 
 return {
-  dispatch_rpc = call_and_handle_unhandled_errors
+  dispatch_rpc = function(procedures, request_string)
+    return call_and_handle_unhandled_errors(invoke_rpc, procedures, request_string)
+  end,
+  dispatch_rpc_batch = function(procedures, request_string)
+    return call_and_handle_unhandled_errors(invoke_rpc_batch, procedures, request_string)
+  end,
 }
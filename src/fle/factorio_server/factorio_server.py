@@ -6,6 +6,7 @@ from typing import BinaryIO, Optional
 
 import importlib
 import importlib.resources
+import io
 import logging
 import os
 import os.path
@@ -60,6 +61,36 @@ async def copy_file_async(src: str, dst: str) -> None:
     await anyio.to_thread.run_sync(shutil.copyfile, src, dst)
 
 
+def _write_save_file_sync(src: BinaryIO, dst_path: str) -> None:
+    """Copies the save file to dst_path, zero-copy via sendfile when src is a
+    real file (the usual case); in-memory sources fall back to copyfileobj"""
+    # Seek 0 because we may have read the file already in the case of a retry
+    src.seek(0)
+    with open(dst_path, "wb") as dst:
+        try:
+            src_fd: Optional[int] = src.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            src_fd = None
+        if src_fd is not None:
+            try:
+                size = os.fstat(src_fd).st_size
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(dst.fileno(), src_fd, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                if offset >= size:
+                    return
+            except OSError:
+                # e.g. filesystems without sendfile support
+                pass
+            src.seek(0)
+            dst.seek(0)
+            dst.truncate()
+        shutil.copyfileobj(src, dst)
+
+
 @define
 class FactorioServer(anyio.abc.AsyncResource):
     tmpdir: str
@@ -92,9 +123,10 @@ class FactorioServer(anyio.abc.AsyncResource):
         await self.process.wait()
         if "PYTEST_CURRENT_TEST" in os.environ:
             # When this fails in tests, print the server log to assist debugging
-            debug_print_server_log(self.tmpdir)
+            await anyio.to_thread.run_sync(debug_print_server_log, self.tmpdir)
         if self.delete_tmpdir:
-            shutil.rmtree(self.tmpdir)
+            # The tmpdir holds hundreds of files; don't block the loop on it
+            await anyio.to_thread.run_sync(shutil.rmtree, self.tmpdir)
 
     def debug_print_server_log(self):
         """Prints the server's logs to our logs
@@ -108,29 +140,20 @@ class FactorioServer(anyio.abc.AsyncResource):
         It is recommended to suffix target_file with ".zip"
         """
         temp_name = str(uuid.uuid4()) + ".zip"
-        # Saving is asynchronous, in order to know it's complete we will tail the logfile during the save
-        # Seek end of log file before we issue our instruction
-        async with await anyio.Path(get_server_log_path(self.tmpdir)).open(
-            "rt"
-        ) as logfile:
-            await logfile.seek(0, os.SEEK_END)
-            await self.rcon.send_command(f"/sc game.server_save('{temp_name}')")
-            expected_out_path = anyio.Path(self.tmpdir, "saves", temp_name)
-            # Allow 10 seconds for this
-            deadline = time.time() + 10
-            while time.time() < deadline:
-                where = await logfile.tell()
-                line = await logfile.readline()
-                if not line or not line.endswith("\n"):
-                    # we reached eof, reset to prior location to get a complete log line
-                    await logfile.seek(where)
-                    await anyio.sleep(0.1)
-                elif "Saving finished" in line:
-                    break
-            else:
-                raise Exception(
-                    f"Timed out waiting for confirmation of saving finished for: {expected_out_path}"
-                )
+        # Saving is asynchronous; factorio writes to a scratch file and renames
+        # into saves/ on completion, so the target appearing means it's done
+        expected_out_path = anyio.Path(self.tmpdir, "saves", temp_name)
+        await self.rcon.send_command(f"/sc game.server_save('{temp_name}')")
+        # Allow 10 seconds for this
+        deadline = time.time() + 10
+        while time.time() < deadline:
+            if await expected_out_path.exists():
+                break
+            await anyio.sleep(0.02)
+        else:
+            raise Exception(
+                f"Timed out waiting for the save file to appear at: {expected_out_path}"
+            )
         # Use copy and delete strat to avoid "OSError: [Errno 18] Invalid cross-device link"
         await copy_file_async(str(expected_out_path), target_file)
         await expected_out_path.unlink()
@@ -142,6 +165,9 @@ async def _open_rcon(address: str, port: int, password: str) -> rcon.RCONClient:
     # Under continuous load, I have observed extremely rarely (1/1000 runs) the readiness of rcon taking over 15 seconds
     deadline = now + 20
     last_exception: Optional[Exception] = None
+    # Refused connections fail near-instantly while the server boots, so back
+    # off between attempts rather than hammering the port with SYNs
+    delay = 0.025
     while time.time() < deadline:
         try:
             await client.connect(2)
@@ -151,6 +177,8 @@ async def _open_rcon(address: str, port: int, password: str) -> rcon.RCONClient:
             last_exception = ex
         except TimeoutError as ex:
             last_exception = ex
+        await anyio.sleep(delay)
+        delay = min(delay * 2, 1.0)
     if last_exception is not None:
         raise last_exception
     return client
@@ -163,12 +191,9 @@ async def _try_create_server(config: FactorioServerConfig) -> FactorioServer:
         savefile_dir = anyio.Path(tmpdir, "saves")
         await savefile_dir.mkdir(parents=True, exist_ok=True)
         savefile_path = savefile_dir / "save.zip"
-        async with await savefile_path.open("wb") as savefile:
-            # TODO asyncio reads
-            # Seek 0 because we may have read the file already in the case of a retry
-            config.save_file_to_load.seek(0)
-            for chunk in iter(lambda: config.save_file_to_load.read(16384), b""):
-                await savefile.write(chunk)
+        await anyio.to_thread.run_sync(
+            _write_save_file_sync, config.save_file_to_load, str(savefile_path)
+        )
         # write config ini, currently just to modify write-data dir
         config_ini_path = os.path.join(tmpdir, "config.ini")
         with open(config_ini_path, "wt", encoding="utf-8") as config_file:
@@ -244,9 +269,9 @@ write-data={tmpdir}
         try:
             if "PYTEST_CURRENT_TEST" in os.environ:
                 # When this fails in tests, print the server log to assist debugging
-                debug_print_server_log(tmpdir)
+                await anyio.to_thread.run_sync(debug_print_server_log, tmpdir)
         finally:
-            shutil.rmtree(tmpdir)
+            await anyio.to_thread.run_sync(shutil.rmtree, tmpdir)
             raise
 
 
@@ -4,7 +4,13 @@ import socket
 
 
 def get_available_port(socket_type: int) -> int:
+    # The probe socket must be closed before the real server can bind the
+    # port, so a small window remains where the OS could hand the same port to
+    # someone else; callers are expected to detect that (see the rcon password
+    # check in factorio_server). SO_REUSEADDR widens the usable pool by
+    # allowing ports that linger in TIME_WAIT from a previous probe.
     with socket.socket(socket.AF_INET, socket_type) as sock:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         sock.bind(("127.0.0.1", 0))
         addr: Tuple[str, int] = sock.getsockname()
         return addr[1]
@@ -3,10 +3,11 @@ Similar to https://github.com/mark9064/factorio-rcon-py except it allows interle
 
 See https://developer.valvesoftware.com/wiki/Source_RCON_Protocol for the protocol spec.
 """
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional
 
 import asyncio
 import logging
+import socket
 import struct
 from asyncio.futures import Future
 from asyncio.streams import StreamReader, StreamWriter
@@ -19,8 +20,9 @@ class RCONAuthFailure(Exception):
     pass
 
 
-@dataclass
-class _Packet:
+# NamedTuple rather than a dataclass: packets are created twice per
+# round-trip and the C-level tuple machinery keeps that cheap
+class _Packet(NamedTuple):
     pkt_id: int
     type: int
     body: str
@@ -34,7 +36,7 @@ class RCONClient:
         self._next_id: int = 0
         self._reader: Optional[StreamReader] = None
         self._writer: Optional[StreamWriter] = None
-        self._expected_responses_by_request_id: Dict[int, _ExpectedResponse] = {}
+        self._pending: "_PendingResponses" = _PendingResponses()
 
     async def aclose(self) -> None:
         if self._writer is not None:
@@ -44,13 +46,31 @@ class RCONClient:
         if self._reader is not None:
             self._reader = None
         self._next_id = 0
-        self._expected_responses_by_request_id = {}
+        self._pending = _PendingResponses()
 
     async def send_command(self, command: str, timeout_seconds: float = 10.0) -> str:
         """Returns the response to command"""
         pkt = _Packet(self._get_next_id(), _SERVERDATA_EXECCOMMAND, command)
         return (await self._send_packet(pkt, timeout_seconds)).body
 
+    async def send_commands(
+        self, commands: List[str], timeout_seconds: float = 10.0
+    ) -> List[str]:
+        """Sends a batch of commands pipelined in a single write
+
+        Returns the responses in command order. The server processes packets
+        sequentially, so this is equivalent to sequential send_command calls
+        minus the per-command round-trip.
+        """
+        pkts = [
+            _Packet(self._get_next_id(), _SERVERDATA_EXECCOMMAND, command)
+            for command in commands
+        ]
+        responses = await asyncio.wait_for(
+            self._send_packets(pkts), timeout=timeout_seconds
+        )
+        return [response.body for response in responses]
+
     async def connect(self, timeout_seconds: float = 10.0) -> None:
         """Makes TCP connection and do login
         Raises RCONAuthFailure on failure to auth"""
@@ -59,9 +79,12 @@ class RCONClient:
         self._reader, self._writer = await asyncio.open_connection(
             self.hostname, self.port
         )
-        asyncio.create_task(
-            _consume_reader(self._reader, self._expected_responses_by_request_id)
-        )
+        sock = self._writer.get_extra_info("socket")
+        if sock is not None:
+            # rcon commands are small and latency-sensitive; don't let Nagle
+            # hold them back waiting for a bigger segment
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        asyncio.create_task(_consume_reader(self._reader, self._pending))
         login_pkt = _Packet(self._get_next_id(), _SERVERDATA_AUTH, self.password)
         response = await self._send_packet(login_pkt, timeout_seconds)
         # The above line should have raised an exception were this not true.
@@ -69,21 +92,46 @@ class RCONClient:
 
     async def _send_packet(self, pkt: _Packet, timeout_seconds: float) -> _Packet:
         async def inner_send() -> _Packet:
-            expected_response = _ExpectedResponse(
-                is_auth=pkt.type == _SERVERDATA_AUTH,
-            )
-            # Take a local ref to self._expected_responses_by_request_id because it can be replaced during close()
-            expected_responses_by_request_id = self._expected_responses_by_request_id
-            expected_responses_by_request_id[pkt.pkt_id] = expected_response
+            is_auth = pkt.type == _SERVERDATA_AUTH
+            expected_response = _ExpectedResponse(is_auth=is_auth)
+            # Take a local ref to self._pending because it can be replaced during close()
+            pending = self._pending
+            pending.by_request_id[pkt.pkt_id] = expected_response
+            if is_auth:
+                pending.auth = expected_response
             try:
                 assert self._writer is not None
                 await _write_packet(self._writer, pkt)
                 return await expected_response.response_future
             finally:
-                del expected_responses_by_request_id[pkt.pkt_id]
+                del pending.by_request_id[pkt.pkt_id]
+                if pending.auth is expected_response:
+                    pending.auth = None
 
         return await asyncio.wait_for(inner_send(), timeout=timeout_seconds)
 
+    async def _send_packets(self, pkts: List[_Packet]) -> List[_Packet]:
+        # Take a local ref to self._pending because it can be replaced during close()
+        pending = self._pending
+        expected_responses = []
+        for pkt in pkts:
+            expected_response = _ExpectedResponse(is_auth=False)
+            pending.by_request_id[pkt.pkt_id] = expected_response
+            expected_responses.append(expected_response)
+        try:
+            assert self._writer is not None
+            buf = bytearray()
+            for pkt in pkts:
+                buf += _pack_packet(pkt)
+            self._writer.write(buf)
+            await self._writer.drain()
+            return list(
+                await asyncio.gather(*[er.response_future for er in expected_responses])
+            )
+        finally:
+            for pkt in pkts:
+                del pending.by_request_id[pkt.pkt_id]
+
     def _get_next_id(self) -> int:
         """Returns incremental positive 32 bit signed int id's and wraps around"""
         pkt_id = self._next_id
@@ -108,6 +156,9 @@ _SERVERDATA_AUTH_RESPONSE = 2
 _SERVERDATA_EXECCOMMAND = 2
 _SERVERDATA_RESPONSE_VALUE = 0
 
+# size + id + type header; compiled once rather than re-looked-up per packet
+_HDR_STRUCT = struct.Struct("<iii")
+
 
 if TYPE_CHECKING:
     # pylint: disable-next=unsubscriptable-object
@@ -116,28 +167,46 @@ else:
     FuturePacket = Future
 
 
-@dataclass
 class _ExpectedResponse:
-    is_auth: bool
-    response_future: FuturePacket = field(
-        default_factory=lambda: asyncio.get_running_loop().create_future()
-    )
+    __slots__ = ("is_auth", "response_future")
+
+    def __init__(self, is_auth: bool):
+        self.is_auth = is_auth
+        self.response_future: FuturePacket = asyncio.get_running_loop().create_future()
+
+
+@dataclass
+class _PendingResponses:
+    """The in-flight requests awaiting responses on one connection
+
+    The at-most-one outstanding auth request is also tracked directly because
+    an auth failure arrives with the sentinel id -1 rather than the request id.
+    """
+
+    by_request_id: Dict[int, _ExpectedResponse] = field(default_factory=dict)
+    auth: Optional[_ExpectedResponse] = None
+
+
+def _pack_packet(pkt: _Packet) -> bytearray:
+    body_bytes = pkt.body.encode("utf8")
+    # size field excludes itself: id + type + body + 2 terminator bytes
+    packet_size = (2 * 4) + len(body_bytes) + 2
+    buf = bytearray(4 + packet_size)
+    _HDR_STRUCT.pack_into(buf, 0, packet_size, pkt.pkt_id, pkt.type)
+    buf[12 : 12 + len(body_bytes)] = body_bytes
+    # the two terminator bytes are already zero from the bytearray init
+    return buf
 
 
 async def _write_packet(writer: StreamWriter, pkt: _Packet) -> None:
-    packet_bytes = (
-        struct.pack("<ii", pkt.pkt_id, pkt.type) + pkt.body.encode("utf8") + b"\x00\x00"
-    )
-    # pack size of packet + rest of packet data
-    packet_with_size = struct.pack("<i", len(packet_bytes)) + packet_bytes
-    writer.write(packet_with_size)
+    writer.write(_pack_packet(pkt))
     await writer.drain()
 
 
 async def _read_packet(reader: StreamReader) -> _Packet:
     # Packet Header = 3 * 4 byte
-    header_bytes = await reader.readexactly(3 * 4)
-    pkt_size, pkt_id, pkt_type = struct.unpack("<iii", header_bytes)
+    header_bytes = await reader.readexactly(_HDR_STRUCT.size)
+    pkt_size, pkt_id, pkt_type = _HDR_STRUCT.unpack(header_bytes)
     bytes_already_read_for_id_and_type = 2 * 4
     len_to_read = pkt_size - bytes_already_read_for_id_and_type
     rest_bytes = await reader.readexactly(len_to_read)
@@ -146,33 +215,32 @@ async def _read_packet(reader: StreamReader) -> _Packet:
     return _Packet(pkt_id, pkt_type, body_bytes.decode("utf-8"))
 
 
-async def _consume_reader(
-    reader: StreamReader, expected_responses_by_request_id: Dict[int, _ExpectedResponse]
-) -> None:
+async def _consume_reader(reader: StreamReader, pending: _PendingResponses) -> None:
+    # Runs for every response packet; bind the per-packet lookups to locals.
+    # pending.by_request_id is mutated in place by the send paths, never
+    # replaced, so holding a direct ref here is safe.
+    get_expected = pending.by_request_id.get
+    auth_response_type = _SERVERDATA_AUTH_RESPONSE
     try:
         while True:
             pkt = await _read_packet(reader)
-            if pkt.type == _SERVERDATA_AUTH_RESPONSE:
+            if pkt.type == auth_response_type:
                 # For SERVERDATA_AUTH_RESPONSE pkt_id only matches the id if its successful
                 # id -1 is the auth failure sentinel
                 if pkt.pkt_id == -1:
-                    auth_responses = [
-                        r
-                        for r in expected_responses_by_request_id.values()
-                        if r.is_auth
-                    ]
-                    # Zero is a problem, and more than one is ambiguous
-                    assert len(auth_responses) == 1
-                    auth_responses[0].response_future.set_exception(
+                    auth_response = pending.auth
+                    # No outstanding auth request would be a protocol violation
+                    assert auth_response is not None
+                    auth_response.response_future.set_exception(
                         RCONAuthFailure("Auth failed", pkt)
                     )
                     continue
-            if pkt.pkt_id not in expected_responses_by_request_id:
+            expected_response = get_expected(pkt.pkt_id)
+            if expected_response is None:
                 LOG.error(
                     "Recieved response for un-tracked request pkt_id: %s", pkt.pkt_id
                 )
                 continue
-            expected_response = expected_responses_by_request_id[pkt.pkt_id]
             if pkt.type == _SERVERDATA_RESPONSE_VALUE and expected_response.is_auth:
                 # Auth is weird. Factorio sends an empty SERVERDATA_RESPONSE_VALUE
                 # matching the request id followed by a SERVERDATA_AUTH_RESPONSE
@@ -1,8 +1,8 @@
-from typing import AsyncIterator, Tuple
+from typing import Optional, Tuple
 
-from contextlib import asynccontextmanager
-
-from attr import define
+import anyio.abc
+import numpy as np
+from attr import define, field
 from grpclib.client import Channel
 
 from .proto.fle import (
@@ -19,12 +19,24 @@ from .proto.fle import (
 
 
 @define
-class CommandLineClient:
+class CommandLineClient(anyio.abc.AsyncResource):
     """A client with an interface designed for the command line interface.
-    All params are flattened to scalars"""
+    All params are flattened to scalars
+
+    One grpc channel is opened lazily on first use and reused for all
+    requests; use as an async context manager (or call aclose) to release it.
+    """
 
     host: str = ""
     port: int = 0
+    _channel: Optional[Channel] = field(init=False, default=None)
+    _stub: Optional[LogisticsBeltPlacementProblemStub] = field(init=False, default=None)
+
+    async def aclose(self) -> None:
+        if self._channel is not None:
+            self._channel.close()
+            self._channel = None
+            self._stub = None
 
     async def create_evaluator(
         self, problem_category: str, problem_size: str, deterministic: bool
@@ -43,29 +55,25 @@ class CommandLineClient:
         create_evaluator_request = CreateEvaluatorRequest(
             converted_problem_category, converted_problem_size, deterministic
         )
-        async with self._lbpp_stub() as lbpp:
-            response = await lbpp.create_evaluator(create_evaluator_request)
-            return response.uuid
+        response = await self._get_stub().create_evaluator(create_evaluator_request)
+        return response.uuid
 
     async def destroy_evaluator(self, evaluator_id: str) -> None:
         evaluator_handle = EvaluatorHandle(evaluator_id)
-        async with self._lbpp_stub() as lbpp:
-            await lbpp.destroy_evaluator(evaluator_handle)
+        await self._get_stub().destroy_evaluator(evaluator_handle)
 
     async def create_world(self, evaluator_id: str) -> Tuple[str, str]:
         create_world_request = CreateWorldRequest(EvaluatorHandle(evaluator_id))
-        async with self._lbpp_stub() as lbpp:
-            response = await lbpp.create_world(create_world_request)
-            return ",".join([str(s) for s in response.shape]), " ".join(
-                [str(val) for val in response.data]
-            )
+        response = await self._get_stub().create_world(create_world_request)
+        return ",".join([str(s) for s in response.shape]), " ".join(
+            [str(val) for val in response.data]
+        )
 
     async def save_world(self, evaluator_id: str, save_file_path: str) -> None:
         save_world_request = SaveWorldRequest(
             EvaluatorHandle(evaluator_id), save_file_path
         )
-        async with self._lbpp_stub() as lbpp:
-            await lbpp.save_world(save_world_request)
+        await self._get_stub().save_world(save_world_request)
 
     async def evaluate_fitness(
         self,
@@ -73,29 +81,34 @@ class CommandLineClient:
         solution_matrix_shape: str,
         solution_matrix_data: str,
     ) -> int:
-        solution_matrix_shape_parsed = [
-            int(s) for s in solution_matrix_shape.split(",")
-        ]
-        solution_matrix_data_parsed = [int(s) for s in solution_matrix_data.split()]
+        # numpy parses the number lists in C; the proto fields still want
+        # plain python lists, hence the tolist round-off
+        solution_matrix_shape_parsed = np.fromstring(
+            solution_matrix_shape, sep=",", dtype=np.int64
+        ).tolist()
+        solution_matrix_data_parsed = np.fromstring(
+            solution_matrix_data, sep=" ", dtype=np.int64
+        ).tolist()
         evaluate_fitness_request = EvaluateFitnessRequest(
             EvaluatorHandle(evaluator_id),
             NdArray(solution_matrix_shape_parsed, solution_matrix_data_parsed),
         )
-        async with self._lbpp_stub() as lbpp:
-            response = await lbpp.evaluate_fitness(evaluate_fitness_request)
-            return response.fitness
+        response = await self._get_stub().evaluate_fitness(evaluate_fitness_request)
+        return response.fitness
 
     async def get_connection_info(
         self,
         evaluator_id: str,
     ) -> str:
-        async with self._lbpp_stub() as lbpp:
-            response = await lbpp.get_connection_info(EvaluatorHandle(evaluator_id))
-            return response.to_json()
+        response = await self._get_stub().get_connection_info(
+            EvaluatorHandle(evaluator_id)
+        )
+        return response.to_json()
 
-    @asynccontextmanager
-    async def _lbpp_stub(
-        self,
-    ) -> AsyncIterator[LogisticsBeltPlacementProblemStub]:
-        async with Channel(self.host, self.port) as channel:
-            yield LogisticsBeltPlacementProblemStub(channel)
+    def _get_stub(self) -> LogisticsBeltPlacementProblemStub:
+        # Built here rather than in __init__ because host/port may be
+        # assigned after construction (see the CLI callback)
+        if self._stub is None:
+            self._channel = Channel(self.host, self.port)
+            self._stub = LogisticsBeltPlacementProblemStub(self._channel)
+        return self._stub
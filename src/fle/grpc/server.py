@@ -1,8 +1,11 @@
-from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, NoReturn
+from typing import TYPE_CHECKING, Any, AsyncIterator, List, NoReturn, Set
 
 import asyncio
 import logging
+import math
+import os
 import uuid
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 
 import anyio.abc
@@ -43,30 +46,45 @@ def _uuid() -> str:
 
 
 def _np_to_proto(arr: npt.NDArray[Any]) -> NdArray:
-    return NdArray(list(arr.shape), arr.flatten().tolist())
+    # ravel is a view (no copy) for contiguous arrays, unlike flatten
+    return NdArray(list(arr.shape), arr.ravel().tolist())
 
 
 def _proto_to_np(arr: NdArray) -> npt.NDArray[Any]:
-    expected_entries = np.prod(arr.shape)
+    # math.prod over the small shape tuple; np.prod would allocate an
+    # ndarray and return a numpy scalar just for this comparison
+    expected_entries = math.prod(arr.shape)
     num_entries = len(arr.data)
     if num_entries != expected_entries:
         _invalid_argument(
             f"Expected {expected_entries} entries in array with shape ({arr.shape}) but got {num_entries}"
         )
-    return np.array(arr.data).reshape(arr.shape)
+    return np.asarray(arr.data, dtype=np.int64).reshape(arr.shape)
 
 
 class LBPPService(LogisticsBeltPlacementProblemBase, anyio.abc.AsyncResource):
     def __init__(self):
-        # TODO cap the number of evaluators we allow
-        self.evaluators: Dict[str, lbpp.Evaluator] = {}
+        # Least-recently-used order; bounded because every evaluator can pin
+        # a whole factorio process until it is destroyed
+        self.evaluators: "OrderedDict[str, lbpp.Evaluator]" = OrderedDict()
+        self.max_evaluators = int(os.environ.get("FLE_MAX_EVALUATORS", "32"))
+        # Keeps eviction-shutdown tasks alive until done; a bare create_task
+        # result can be garbage-collected mid-run and swallow exceptions
+        self._eviction_tasks: Set["asyncio.Task[None]"] = set()
 
     async def aclose(self):
-        await asyncio.gather(*[ev.aclose() for ev in self.evaluators.values()])
+        # Wait out in-flight eviction shutdowns along with the live evaluators
+        await asyncio.gather(
+            *[ev.aclose() for ev in self.evaluators.values()], *self._eviction_tasks
+        )
 
     async def create_evaluator(
         self, create_evaluator_request: CreateEvaluatorRequest
     ) -> EvaluatorHandle:
+        """Creates an evaluator, evicting the least recently used one when
+        the cap is hit. An evicted evaluator is closed even if requests to it
+        are in flight; those requests then fail with 'No evaluator with id'.
+        """
         problem_category_map = {
             CreateEvaluatorRequestProblemCategory.STATIC: lbpp.PROBLEMS.STATIC,
             CreateEvaluatorRequestProblemCategory.DYNAMIC: lbpp.PROBLEMS.DYNAMIC,
@@ -86,6 +104,16 @@ class LBPPService(LogisticsBeltPlacementProblemBase, anyio.abc.AsyncResource):
                 f"Invalid problem_size {create_evaluator_request.problem_size}"
             )
         problem_class = problem_size_map[create_evaluator_request.problem_size]
+        while len(self.evaluators) >= self.max_evaluators:
+            evicted_id, evicted = self.evaluators.popitem(last=False)
+            LOG.warning(
+                "Evaluator cap (%s) reached, evicting least recently used %s",
+                self.max_evaluators,
+                evicted_id,
+            )
+            eviction_task = asyncio.create_task(evicted.aclose())
+            self._eviction_tasks.add(eviction_task)
+            eviction_task.add_done_callback(self._on_eviction_done)
         evaluator_id = _uuid()
         evaluator = lbpp.Evaluator(
             problem_class, create_evaluator_request.deterministic
@@ -93,6 +121,11 @@ class LBPPService(LogisticsBeltPlacementProblemBase, anyio.abc.AsyncResource):
         self.evaluators[evaluator_id] = evaluator
         return EvaluatorHandle(evaluator_id)
 
+    def _on_eviction_done(self, task: "asyncio.Task[None]") -> None:
+        self._eviction_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            LOG.error("Evicted evaluator failed to close", exc_info=task.exception())
+
     async def destroy_evaluator(self, evaluator_handle: EvaluatorHandle) -> Empty:
         evaluator_inst = self._lookup_evaluator(evaluator_handle)
         del self.evaluators[evaluator_handle.uuid]
@@ -141,6 +174,7 @@ class LBPPService(LogisticsBeltPlacementProblemBase, anyio.abc.AsyncResource):
         evaluator = self.evaluators.get(evaluator_handle.uuid, None)
         if evaluator is None:
             _invalid_argument(f"No evaluator with id {evaluator_handle.uuid}")
+        self.evaluators.move_to_end(evaluator_handle.uuid)
         return evaluator
 
 
@@ -1,11 +1,7 @@
+# Importing lbpp_gym registers the envs as a side effect, so
+# `import fle.gym` is all a user needs before gym.make
 from ..environments.logistics_belt_placement_problem import gym as lbpp_gym
 
-_HAS_REGISTERED = False
-
 
 def register_fle_with_gym():
-    global _HAS_REGISTERED
-    if _HAS_REGISTERED:
-        return
-    _HAS_REGISTERED = True
-    lbpp_gym.register()
+    """Kept for backwards compatibility; importing this package registers."""
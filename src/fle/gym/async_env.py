@@ -1,5 +1,6 @@
 """ An async version of gym.Env """
 
+from types import ModuleType
 from typing import Any, Awaitable, Dict, List, Optional, Tuple, TypeVar, Union
 
 import asyncio
@@ -7,8 +8,22 @@ from abc import ABC, abstractmethod
 
 import gym
 import gym.version
+import numpy as np
+import numpy.typing as npt
 from anyio.abc import AsyncResource
 
+# Optional speedup (the "speedups" extra): libuv-based event loop cuts
+# callback-scheduling overhead on the many short coroutine runs the sync
+# gym API makes. Held as an Optional module so the fallback stays clean
+# for mypy with or without uvloop installed.
+_UVLOOP: Optional[ModuleType]
+try:
+    import uvloop
+
+    _UVLOOP = uvloop
+except ImportError:
+    _UVLOOP = None
+
 ObsTypeT = TypeVar("ObsTypeT")
 ActTypeT = TypeVar("ActTypeT")
 
@@ -140,11 +155,40 @@ class AsyncEnv(gym.Env[ObsTypeT, ActTypeT], ABC, AsyncResource):
         return_info: bool = False,
         options: Optional[Dict[str, object]] = None,
     ) -> Union[ObsTypeT, Tuple[ObsTypeT, Dict[str, object]]]:
-        super().reset(seed=seed, return_info=return_info, options=options)
+        self._reset_base_env(seed=seed, return_info=return_info, options=options)
         return await self._reset_async(
             seed=seed, return_info=return_info, options=options
         )
 
+    async def step_batch_async(
+        self, actions: List[ActTypeT]
+    ) -> List[Tuple[ObsTypeT, float, bool, Dict[str, Any]]]:
+        """Runs a batch of actions concurrently and returns results in order.
+
+        The steps overlap on the event loop, so IO-bound _step_async
+        implementations turn serial round-trip latency into parallel
+        throughput. Only use this on envs whose _step_async calls are safe
+        to interleave. Envs that act on one shared world (as the lbpp GymEnv
+        does) are NOT: the overlapping RPCs mix both actions into the same
+        world and return corrupted fitness/observations. Use VectorGymEnv to
+        parallelize across worlds instead.
+        """
+        return await asyncio.gather(*[self._step_async(action) for action in actions])
+
+    async def step_into_async(
+        self, action: ActTypeT, obs_out: npt.NDArray[Any]
+    ) -> Tuple[float, bool, Dict[str, Any]]:
+        """Like step_async, but writes the observation into a caller buffer.
+
+        Lets tight RL loops reuse one observation array across steps instead
+        of allocating per step. This default copies from _step_async's
+        result; subclasses with array observations can override it to fill
+        obs_out directly.
+        """
+        obs, reward, done, info = await self._step_async(action)
+        np.copyto(obs_out, obs)
+        return (reward, done, info)
+
     async def aclose(self) -> None:
         """Async close"""
         return await self._close_async()
@@ -157,8 +201,12 @@ class AsyncEnv(gym.Env[ObsTypeT, ActTypeT], ABC, AsyncResource):
     # Sync interface
     #
 
+    # The sync wrappers call the _*_async implementations directly rather
+    # than going through the public *_async entrypoints; that saves one
+    # coroutine frame per call, which adds up in tight stepping loops.
+
     def step(self, action: ActTypeT) -> Tuple[ObsTypeT, float, bool, Dict[str, Any]]:
-        return _run_in_eventloop(self.step_async(action))
+        return _run_in_eventloop(self._step_async(action))
 
     # The optional arg prepares us for the next release of gym
     # pylint: disable-next=arguments-differ
@@ -169,35 +217,67 @@ class AsyncEnv(gym.Env[ObsTypeT, ActTypeT], ABC, AsyncResource):
         return_info: bool = False,
         options: Optional[Dict[str, object]] = None,
     ) -> Union[ObsTypeT, Tuple[ObsTypeT, Dict[str, object]]]:
+        self._reset_base_env(seed=seed, return_info=return_info, options=options)
         return _run_in_eventloop(
-            self.reset_async(seed=seed, return_info=return_info, options=options)
+            self._reset_async(seed=seed, return_info=return_info, options=options)
         )
 
+    def _reset_base_env(
+        self,
+        *,
+        seed: Optional[int],
+        return_info: bool,
+        options: Optional[Dict[str, object]],
+    ) -> None:
+        """gym.Env.reset only does RNG bookkeeping; skip it when seed is None
+        and a PRNG already exists, which the gym contract says must not reset
+        the RNG anyway"""
+        if seed is not None or getattr(self, "_np_random", None) is None:
+            super().reset(seed=seed, return_info=return_info, options=options)
+
     def render(self, mode: str = "human") -> None:
         raise NotImplementedError(
             "Factorio learning environments currently don't support rendering."
         )
 
+    def step_into(
+        self, action: ActTypeT, obs_out: npt.NDArray[Any]
+    ) -> Tuple[float, bool, Dict[str, Any]]:
+        return _run_in_eventloop(self.step_into_async(action, obs_out))
+
+    def step_batch(
+        self, actions: List[ActTypeT]
+    ) -> List[Tuple[ObsTypeT, float, bool, Dict[str, Any]]]:
+        return _run_in_eventloop(self.step_batch_async(actions))
+
     def close(self) -> None:
-        return _run_in_eventloop(self.aclose())
+        return _run_in_eventloop(self._close_async())
 
     def seed(self, seed: Optional[int] = None) -> List[int]:
-        return _run_in_eventloop(self.seed_async(seed))
+        super().seed(seed)
+        return _run_in_eventloop(self._seed_async(seed))
 
 
 T = TypeVar("T")
 
+_CACHED_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
 
 def _run_in_eventloop(co: Awaitable[T]) -> T:
     """asyncio has deprecated implicit event loop creation in get_event_loop
 
-    This function restores it by running the given coroutine
-    in an existing or new event loop implicitly"""
-    loop = None
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        pass
+    This function restores it by running the given coroutine in one
+    lazily-created event loop shared by every sync API call"""
+    # The C-level accessor returns None instead of raising, which keeps
+    # exception handling off this per-step path
+    loop = asyncio._get_running_loop()  # pylint: disable=protected-access
     if loop is None:
-        loop = asyncio.get_event_loop_policy().get_event_loop()
+        global _CACHED_LOOP
+        if _CACHED_LOOP is None:
+            if _UVLOOP is not None:
+                _CACHED_LOOP = _UVLOOP.new_event_loop()
+            else:
+                _CACHED_LOOP = asyncio.new_event_loop()
+            asyncio.set_event_loop(_CACHED_LOOP)
+        loop = _CACHED_LOOP
     return loop.run_until_complete(co)
@@ -0,0 +1,85 @@
+""" Vectorized execution of multiple AsyncEnv instances """
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import asyncio
+
+import numpy as np
+import numpy.typing as npt
+from anyio.abc import AsyncResource
+
+from .async_env import AsyncEnv, _run_in_eventloop
+
+
+class VectorGymEnv(AsyncResource):
+    """Fans batched step/reset calls out over a pool of AsyncEnv instances.
+
+    The per-env coroutines run concurrently on one event loop, overlapping the
+    Factorio server simulation windows which dominate the wall-clock time of a
+    step. The batched API follows the usual vector-env shape:
+
+        obs, rewards, dones, infos = env.step(actions)
+
+    where the leading axis of each value is the env index.
+    """
+
+    def __init__(
+        self, make_fn: Callable[[], AsyncEnv[Any, Any]], num_envs: int
+    ) -> None:
+        self.num_envs = num_envs
+        self.envs: List[AsyncEnv[Any, Any]] = [make_fn() for _ in range(num_envs)]
+
+    #
+    # Async interface
+    #
+
+    async def step_async(
+        self, actions: Sequence[Any]
+    ) -> Tuple[
+        npt.NDArray[Any],
+        npt.NDArray[np.float64],
+        npt.NDArray[np.bool_],
+        List[Dict[str, Any]],
+    ]:
+        assert len(actions) == self.num_envs
+        results = await asyncio.gather(
+            *[env.step_async(action) for env, action in zip(self.envs, actions)]
+        )
+        observations, rewards, dones, infos = zip(*results)
+        return (
+            np.stack(observations),
+            np.array(rewards, dtype=np.float64),
+            np.array(dones, dtype=np.bool_),
+            list(infos),
+        )
+
+    async def reset_async(self, *, seed: Optional[int] = None) -> npt.NDArray[Any]:
+        # Offset the seed per env so the envs don't all replay the same episode
+        seeds = [None if seed is None else seed + i for i in range(self.num_envs)]
+        observations = await asyncio.gather(
+            *[env.reset_async(seed=s) for env, s in zip(self.envs, seeds)]
+        )
+        return np.stack(observations)
+
+    async def aclose(self) -> None:
+        await asyncio.gather(*[env.aclose() for env in self.envs])
+
+    #
+    # Sync interface
+    #
+
+    def step(
+        self, actions: Sequence[Any]
+    ) -> Tuple[
+        npt.NDArray[Any],
+        npt.NDArray[np.float64],
+        npt.NDArray[np.bool_],
+        List[Dict[str, Any]],
+    ]:
+        return _run_in_eventloop(self.step_async(actions))
+
+    def reset(self, *, seed: Optional[int] = None) -> npt.NDArray[Any]:
+        return _run_in_eventloop(self.reset_async(seed=seed))
+
+    def close(self) -> None:
+        return _run_in_eventloop(self.aclose())
@@ -0,0 +1,10 @@
+import pytest
+
+from fle.gym import register_fle_with_gym
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _register_gym_envs():
+    """Importing fle.gym registers the envs; this pins that to session setup
+    so every test module sees them regardless of import order"""
+    register_fle_with_gym()
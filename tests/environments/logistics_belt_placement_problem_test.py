@@ -7,7 +7,6 @@ import numpy as np
 import pytest
 
 import fle.environments.logistics_belt_placement_problem as lbpp
-from fle.gym import register_fle_with_gym
 
 EXPECTED_STATIC_3X3_OBS = [
     [5, 5, 13, 5, 5, 5, 5],
@@ -20,12 +19,25 @@ EXPECTED_STATIC_3X3_OBS = [
 ]
 
 
-async def test_determinism_of_problems():
-    a = lbpp.generate_problem(12, random.Random(42))
-    b = lbpp.generate_problem(12, random.Random(42))
+@pytest.mark.parametrize("dimension", [3, 6, 12])
+@pytest.mark.parametrize("seed", [0, 1, 42])
+async def test_determinism_of_problems(dimension: int, seed: int) -> None:
+    a = lbpp.generate_problem(dimension, random.Random(seed))
+    b = lbpp.generate_problem(dimension, random.Random(seed))
     assert a == b
 
 
+async def test_generate_batch_matches_seeded_generation():
+    base_seed = 100
+    batch = await lbpp.generate_batch(6, 4, base_seed)
+    # Problem i must be exactly what random.Random(base_seed + i) produces,
+    # so batches are reproducible regardless of how the pool partitions them
+    expected = [
+        lbpp.generate_problem(6, random.Random(base_seed + i)) for i in range(4)
+    ]
+    assert batch == expected
+
+
 @pytest.mark.parametrize("deterministic", [True, False])
 async def test_static_problem_correct_solution(deterministic: bool) -> None:
     problem_class = lbpp.PROBLEMS.STATIC.SIZE_3x3
@@ -69,11 +81,6 @@ async def test_dynamic_problem(deterministic: bool) -> None:
         assert (observations[0] != observations[1]).any()
 
 
-@pytest.fixture(scope="module", autouse=True)
-def gym_registration():
-    register_fle_with_gym()
-
-
 def test_gym_api():
     with gym.make(
         "factorio-learning-environment/LogisticsBeltPlacementProblem-Static-3x3-Nondeterministic-v0"
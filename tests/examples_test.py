@@ -1,6 +1,6 @@
 """Runs the examples in the examples folder"""
 
-import subprocess
+import asyncio
 import sys
 from pathlib import Path
 
@@ -8,33 +8,31 @@ EXAMPLES_DIR = Path(__file__, "..", "..", "examples").resolve()
 PYTHON_DIR = EXAMPLES_DIR / "python-library"
 
 
-def test_python_direct_api():
-    direct_api_script_path = PYTHON_DIR / "direct_api_example.py"
-    subprocess.check_call(
-        [sys.executable, direct_api_script_path],
-        shell=False,
-        cwd=PYTHON_DIR,
-        timeout=60,
-    )
-
-
-def test_python_gym_api():
-    gym_api_script_path = PYTHON_DIR / "gym_api_example.py"
-    subprocess.check_call(
-        [sys.executable, gym_api_script_path],
-        shell=False,
-        cwd=PYTHON_DIR,
-        timeout=60,
-    )
-
-
-def test_cli():
-    cli_dir = EXAMPLES_DIR / "cli"
+async def _run_example(program: str, *args: str, cwd: Path) -> None:
     # TODO handle cleanup of entire process tree which is spawned,
-    # because check_call timeout does sigkill which prevents bash cleaning up
-    subprocess.check_call(
-        ["/bin/bash", "./cli-example.sh"],
-        shell=False,
-        cwd=cli_dir,
-        timeout=60,
+    # because the timeout kill prevents bash cleaning up
+    proc = await asyncio.create_subprocess_exec(program, *args, cwd=cwd)
+    try:
+        returncode = await asyncio.wait_for(proc.wait(), timeout=60)
+    except asyncio.TimeoutError:
+        proc.kill()
+        raise
+    assert returncode == 0, f"{program} exited with {returncode}"
+
+
+async def test_all_examples():
+    """Runs the three examples concurrently; each spawns its own servers.
+
+    Only the CLI example binds a fixed port (the default grpc port), the
+    python examples run in-process with OS-assigned ports, so the three don't
+    contend with each other.
+    """
+    await asyncio.gather(
+        _run_example(
+            sys.executable, str(PYTHON_DIR / "direct_api_example.py"), cwd=PYTHON_DIR
+        ),
+        _run_example(
+            sys.executable, str(PYTHON_DIR / "gym_api_example.py"), cwd=PYTHON_DIR
+        ),
+        _run_example("/bin/bash", "./cli-example.sh", cwd=EXAMPLES_DIR / "cli"),
     )
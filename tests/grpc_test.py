@@ -2,6 +2,7 @@ import asyncio.base_events
 import logging
 from contextlib import closing
 
+import numpy as np
 import pytest
 
 from fle.grpc.client import CommandLineClient
@@ -45,9 +46,11 @@ async def test_grpc(caplog: pytest.LogCaptureFixture) -> None:
                 expected_obs = EXPECTED_STATIC_3X3_OBS
                 expected_obs_shape = f"{len(expected_obs)},{len(expected_obs[0])}"
                 assert observation_matrix_shape == expected_obs_shape
-                observation_matrix_data_parsed = [
-                    int(s) for s in observation_matrix_data.split()
-                ]
+                # numpy parses the integers in one C loop, matching how the
+                # client itself parses solution matrices
+                observation_matrix_data_parsed = np.fromstring(
+                    observation_matrix_data, sep=" ", dtype=np.int64
+                ).tolist()
                 expected_obs_flattened = [item for row in expected_obs for item in row]
                 assert observation_matrix_data_parsed == expected_obs_flattened
                 fitness = await client.evaluate_fitness(
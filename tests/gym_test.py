@@ -0,0 +1,101 @@
+"""Tests for the gym adapter layer that don't need a factorio server"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import asyncio
+
+import numpy as np
+import numpy.typing as npt
+
+from fle.environments.logistics_belt_placement_problem.gym import (
+    GymEnv,
+    make_vector_env,
+)
+from fle.environments.logistics_belt_placement_problem.problems import DynamicProblem
+from fle.gym.async_env import AsyncEnv
+from fle.gym.vector import VectorGymEnv
+
+
+class _StubEnv(AsyncEnv[npt.NDArray[np.uint8], int]):
+    """Records calls and echoes deterministic observations, no IO"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.seeds: List[Optional[int]] = []
+        self.last_obs = np.zeros(4, dtype=np.uint8)
+
+    async def _step_async(
+        self, action: int
+    ) -> Tuple[npt.NDArray[np.uint8], float, bool, Dict[str, Any]]:
+        await asyncio.sleep(0)
+        self.last_obs = np.full(4, action, dtype=np.uint8)
+        return (self.last_obs, float(action), True, {})
+
+    async def _reset_async(
+        self,
+        *,
+        seed: Optional[int] = None,
+        return_info: bool = False,
+        options: Optional[Dict[str, object]] = None,
+    ) -> npt.NDArray[np.uint8]:
+        self.seeds.append(seed)
+        return np.full(4, 0 if seed is None else seed, dtype=np.uint8)
+
+    def _reset_base_env(self, **_kwargs: Any) -> None:
+        """Skip gym's RNG bookkeeping; the stub has no RNG and this keeps the
+        test independent of the installed gym's reset signature"""
+
+    async def _close_async(self) -> None:
+        pass
+
+    async def _seed_async(self, seed: Optional[int] = None) -> List[int]:
+        self.seeds.append(seed)
+        return [seed or 0]
+
+
+async def test_vector_env_steps_and_resets_in_env_order():
+    # VectorGymEnv.envs is typed on the AsyncEnv base, so keep our own
+    # typed references to the stubs for the assertions below
+    stubs: List[_StubEnv] = []
+
+    def _make_stub() -> _StubEnv:
+        stub = _StubEnv()
+        stubs.append(stub)
+        return stub
+
+    vector = VectorGymEnv(_make_stub, 3)
+    obs = await vector.reset_async(seed=10)
+    # Per-env seed offsets, applied to each env exactly once
+    assert [env.seeds for env in stubs] == [[10], [11], [12]]
+    assert (obs == np.array([[10] * 4, [11] * 4, [12] * 4])).all()
+    observations, rewards, dones, infos = await vector.step_async([5, 6, 7])
+    assert (observations == np.array([[5] * 4, [6] * 4, [7] * 4])).all()
+    assert rewards.tolist() == [5.0, 6.0, 7.0]
+    assert dones.all()
+    assert infos == [{}, {}, {}]
+    await vector.aclose()
+
+
+async def test_step_into_fills_caller_buffer():
+    env = _StubEnv()
+    buf = np.zeros(4, dtype=np.uint8)
+    reward, done, info = await env.step_into_async(9, buf)
+    assert (buf == 9).all()
+    assert (reward, done, info) == (9.0, True, {})
+    # The caller's buffer is filled, not swapped for the env's own array
+    assert buf is not env.last_obs
+    await env.aclose()
+
+
+def test_make_vector_env_isolates_problem_state():
+    vector = make_vector_env(DynamicProblem(3), 2)
+    first, second = vector.envs
+    assert isinstance(first, GymEnv)
+    assert isinstance(second, GymEnv)
+    # Each env must own its problem class; seeding one is per-instance
+    # state and must not leak into its pool-mates
+    assert first.problem_class is not second.problem_class
+    first.problem_class.seed(1)
+    second.problem_class.seed(2)
+    assert first.problem_class.get_seed() == 1
+    assert second.problem_class.get_seed() == 2